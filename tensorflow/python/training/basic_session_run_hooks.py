@@ -174,6 +174,8 @@ class LoggingTensorHook(session_run_hook.SessionRunHook):
 class StopAtStepHook(session_run_hook.SessionRunHook):
   """Monitor to request stop at a specified step."""
 
+  stateless = True
+
   def __init__(self, num_steps=None, last_step=None):
     """Create a StopAtStep Hook.
 
@@ -206,7 +208,7 @@ class StopAtStepHook(session_run_hook.SessionRunHook):
       raise RuntimeError("Global step should be created to use StopAtStepHook.")
 
   def before_run(self, run_context):  # pylint: disable=unused-argument
-    return SessionRunArgs(self._global_step_tensor)
+    return SessionRunArgs.single(self._global_step_tensor)
 
   def after_run(self, run_context, run_values):
     global_step = run_values.results
@@ -273,7 +275,7 @@ class CheckpointSaverHook(session_run_hook.SessionRunHook):
       self._summary_writer.add_graph(graph)
       self._summary_writer.add_meta_graph(meta_graph_def)
 
-    return SessionRunArgs(self._global_step_tensor)
+    return SessionRunArgs.single(self._global_step_tensor)
 
   def after_run(self, run_context, run_values):
     global_step = run_values.results
@@ -302,6 +304,8 @@ class CheckpointSaverHook(session_run_hook.SessionRunHook):
 class StepCounterHook(session_run_hook.SessionRunHook):
   """Steps per second monitor."""
 
+  stateless = True
+
   def __init__(self,
                every_n_steps=100,
                every_n_secs=None,
@@ -326,7 +330,7 @@ class StepCounterHook(session_run_hook.SessionRunHook):
           "Global step should be created to use StepCounterHook.")
 
   def before_run(self, run_context):  # pylint: disable=unused-argument
-    return SessionRunArgs(self._global_step_tensor)
+    return SessionRunArgs.single(self._global_step_tensor)
 
   def after_run(self, run_context, run_values):
     _ = run_context
@@ -357,6 +361,8 @@ class NanTensorHook(session_run_hook.SessionRunHook):
   Can either fail with exception or just stop training.
   """
 
+  stateless = True
+
   def __init__(self, loss_tensor, fail_on_nan_loss=True):
     """Initializes NanLoss monitor.
 
@@ -368,7 +374,7 @@ class NanTensorHook(session_run_hook.SessionRunHook):
     self._fail_on_nan_loss = fail_on_nan_loss
 
   def before_run(self, run_context):  # pylint: disable=unused-argument
-    return SessionRunArgs(self._loss_tensor)
+    return SessionRunArgs.single(self._loss_tensor)
 
   def after_run(self, run_context, run_values):
     if np.isnan(run_values.results):
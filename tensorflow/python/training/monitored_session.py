@@ -20,6 +20,10 @@ from __future__ import division
 from __future__ import print_function
 
 import abc
+import sys
+import threading
+
+import six
 
 from tensorflow.core.protobuf import config_pb2
 from tensorflow.core.protobuf import saver_pb2
@@ -31,6 +35,7 @@ from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import data_flow_ops
 from tensorflow.python.ops import resources
 from tensorflow.python.ops import variables
+from tensorflow.python.platform import tf_logging as logging
 from tensorflow.python.training import basic_session_run_hooks
 from tensorflow.python.training import coordinator
 from tensorflow.python.training import queue_runner
@@ -401,7 +406,7 @@ class MonitoredSession(object):
 
   * calls `hook.before_run()`
   * calls TensorFlow `session.run()` with merged fetches and feed_dict
-  * calls `hook.after_run()`
+  * calls `hook.after_run()`, or `hook.on_error()` if `session.run()` raised
   * returns result of `session.run()` asked by user
   * if `AbortedError` occurs, it recovers or reinitializes the session before
     executing the run() call again
@@ -438,13 +443,23 @@ class MonitoredSession(object):
     """
     self._graph_was_finalized = ops.get_default_graph().finalized
     self._hooks = hooks or []
+    # Hooks are begun one after the other: the name scope and control
+    # dependencies stacks are shared by all threads using a graph, while the
+    # default graph is per thread, so begin() can not be run concurrently.
+    # pylint: disable=protected-access
     for h in self._hooks:
-      h.begin()
+      if session_run_hook._implements(h, 'begin'):
+        h.begin()
+    self._end_callbacks = tuple(
+        h.end for h in self._hooks if session_run_hook._implements(h, 'end'))
+    # pylint: enable=protected-access
     # Create the session.
     self._coordinated_creator = self._CoordinatedSessionCreator(
         session_creator=session_creator or ChiefSessionCreator(),
         hooks=self._hooks)
     self._sess = _RecoverableSession(self._coordinated_creator)
+    # Set by `session_run_hook.skip_hooks()` to bypass the hooks.
+    self._hook_dispatcher = None
 
   @property
   def graph(self):
@@ -467,6 +482,12 @@ class MonitoredSession(object):
     Returns:
       Same as `tf.Session.run()`.
     """
+    if self._hook_dispatcher is not None:
+      return self._hook_dispatcher.dispatch(self._coordinated_creator.tf_sess,
+                                            fetches,
+                                            feed_dict=feed_dict,
+                                            options=options,
+                                            run_metadata=run_metadata)
     return self._sess.run(fetches,
                           feed_dict=feed_dict,
                           options=options,
@@ -512,8 +533,8 @@ class MonitoredSession(object):
   def _close_internal(self, exception_type=None):
     try:
       if not exception_type:
-        for h in self._hooks:
-          h.end(self._coordinated_creator.tf_sess)
+        for end in self._end_callbacks:
+          end(self._coordinated_creator.tf_sess)
     finally:
       try:
         self._sess.close()
@@ -682,7 +703,9 @@ class _HookedSession(_WrappedSession):
 
   When the `run()` call finishes, the session calls the `after_run()` methods of
   the hooks, passing the values returned by the `run()` call corresponding to
-  the ops and tensors that each hook requested.
+  the ops and tensors that each hook requested.  If the `run()` call raises,
+  the `on_error()` methods of the hooks are called instead and the exception is
+  re-raised.
 
   If any call to the hooks, requests stop via run_context the session will be
   marked as needing to stop and its `should_stop()` method will now return
@@ -699,6 +722,34 @@ class _HookedSession(_WrappedSession):
 
     _WrappedSession.__init__(self, sess)
     self._hooks = hooks
+    # The callbacks are bound once here, so that steps only iterate over
+    # tuples of the callbacks hooks actually implement.
+    # pylint: disable=protected-access
+    before_run_callbacks = tuple(
+        (h, h.before_run) for h in hooks
+        if session_run_hook._implements(h, 'before_run'))
+    self._after_run_callbacks = tuple(
+        (h, h.after_run) for h in hooks
+        if session_run_hook._implements(h, 'after_run'))
+    self._on_error_callbacks = tuple(
+        h.on_error for h in hooks
+        if session_run_hook._implements(h, 'on_error'))
+    self._stateless_callbacks = tuple(
+        (h, before_run) for h, before_run in before_run_callbacks
+        if session_run_hook._is_stateless(h))
+    self._before_run_callbacks = tuple(
+        (h, before_run) for h, before_run in before_run_callbacks
+        if not session_run_hook._is_stateless(h))
+    # pylint: enable=protected-access
+    self._run_context = session_run_hook.SessionRunContext(
+        original_args=None, session=sess)
+    # Held while a step uses `_run_context`.
+    self._run_context_lock = threading.Lock()
+    # Requests of the stateless hooks, collected at the first step.
+    self._stateless_requests = None
+    self._has_step_hooks = bool(before_run_callbacks or
+                                self._after_run_callbacks or
+                                self._on_error_callbacks)
     self._should_stop = False
 
   def _check_stop(self):
@@ -710,51 +761,115 @@ class _HookedSession(_WrappedSession):
     if self.should_stop():
       raise RuntimeError('Run called even after should_stop requested.')
 
-    actual_fetches = {'caller': fetches}
-
-    run_context = session_run_hook.SessionRunContext(
-        original_args=session_run_hook.SessionRunArgs(fetches, feed_dict),
-        session=self._sess)
+    if not self._has_step_hooks:
+      # Nothing to dispatch to, skip building the per-step hook structures.
+      return _WrappedSession.run(self,
+                                 fetches=fetches,
+                                 feed_dict=feed_dict,
+                                 options=options,
+                                 run_metadata=run_metadata)
+
+    original_args = session_run_hook.SessionRunArgs(fetches, feed_dict)
+    # The same context is passed to the hooks at every step, unless another
+    # thread is running a step with it.
+    if not self._run_context_lock.acquire(False):
+      run_context = session_run_hook.SessionRunContext(
+          original_args=original_args, session=self._sess)
+      return self._run_with_hooks(run_context, fetches, feed_dict, options,
+                                  run_metadata)
+    try:
+      run_context = self._run_context
+      run_context._reset(original_args)  # pylint: disable=protected-access
+      return self._run_with_hooks(run_context, fetches, feed_dict, options,
+                                  run_metadata)
+    finally:
+      self._run_context_lock.release()
 
+  def _run_with_hooks(self, run_context, fetches, feed_dict, options,
+                      run_metadata):
+    """Runs one step, calling the hooks with `run_context`."""
     options = options or config_pb2.RunOptions()
-    feed_dict = self._call_hook_before_run(run_context, actual_fetches,
+    fetch_requests = []
+    feed_dict = self._call_hook_before_run(run_context, fetch_requests,
                                            feed_dict, options)
 
+    requests = [request for _, request in fetch_requests]
+    # pylint: disable=protected-access
+    actual_fetches, offsets = session_run_hook._merge_run_args(fetches,
+                                                               requests)
+    # pylint: enable=protected-access
+    hook_results_slices = {}
+    for i, (hook, request) in enumerate(fetch_requests):
+      hook_results_slices[hook] = (request, offsets[i], offsets[i + 1])
+
     # Do session run.
     run_metadata = run_metadata or config_pb2.RunMetadata()
-    outputs = _WrappedSession.run(self,
-                                  fetches=actual_fetches,
-                                  feed_dict=feed_dict,
-                                  options=options,
-                                  run_metadata=run_metadata)
-
-    for hook in self._hooks:
-      hook.after_run(
-          run_context,
-          session_run_hook.SessionRunValues(
-              results=outputs[hook] if hook in outputs else None,
-              options=options,
-              run_metadata=run_metadata))
+    try:
+      outputs = _WrappedSession.run(self,
+                                    fetches=actual_fetches,
+                                    feed_dict=feed_dict,
+                                    options=options,
+                                    run_metadata=run_metadata)
+    except Exception as e:  # pylint: disable=broad-except
+      exc_info = sys.exc_info()
+      for on_error in self._on_error_callbacks:
+        try:
+          on_error(run_context, e)
+        except Exception as hook_error:  # pylint: disable=broad-except
+          # The error of the run() call is the one re-raised. A failing hook
+          # must neither hide it nor keep the other hooks from being notified.
+          logging.error('Exception in SessionRunHook.on_error(): %s',
+                        str(hook_error))
+      self._should_stop = self._should_stop or run_context.stop_requested
+      six.reraise(*exc_info)
+
+    for hook, after_run in self._after_run_callbacks:
+      if hook in hook_results_slices:
+        request, start, end = hook_results_slices[hook]
+        # The nested results are only built if the hook reads them.
+        # pylint: disable=protected-access
+        run_values = session_run_hook.SessionRunValues._from_flat_results(
+            request, outputs[start:end], options, run_metadata)
+        # pylint: enable=protected-access
+      else:
+        run_values = session_run_hook.SessionRunValues(
+            results=None, options=options, run_metadata=run_metadata)
+      after_run(run_context, run_values)
     self._should_stop = self._should_stop or run_context.stop_requested
 
-    return outputs['caller']
+    return outputs[0]
 
-  def _call_hook_before_run(self, run_context, fetch_dict, user_feed_dict,
+  def _call_hook_before_run(self, run_context, fetch_requests, user_feed_dict,
                             options):
     """Calls hooks.before_run and handles requests from hooks."""
+    if self._stateless_requests is None:
+      stateless_requests = ([], {}, [])
+      self._collect_hook_requests(run_context, self._stateless_callbacks,
+                                  *stateless_requests)
+      self._stateless_requests = stateless_requests
+    stateless_fetch_requests, stateless_feeds, stateless_options = (
+        self._stateless_requests)
+
+    fetch_requests.extend(stateless_fetch_requests)
     hook_feeds = {}
-    for hook in self._hooks:
-      request = hook.before_run(run_context)
-      if request is not None:
-        if request.fetches is not None:
-          fetch_dict[hook] = request.fetches
-        if request.feed_dict:
-          self._raise_if_feeds_intersects(
-              hook_feeds, request.feed_dict,
-              'Same tensor is fed by two hooks.')
-          hook_feeds.update(request.feed_dict)
-        if request.options:
-          self._merge_run_options(options, request.options)
+    hook_options = []
+    self._collect_hook_requests(run_context, self._before_run_callbacks,
+                                fetch_requests, hook_feeds, hook_options)
+    for incoming_options in stateless_options:
+      self._merge_run_options(options, incoming_options)
+    for incoming_options in hook_options:
+      self._merge_run_options(options, incoming_options)
+
+    if stateless_feeds:
+      if hook_feeds:
+        self._raise_if_feeds_intersects(
+            stateless_feeds, hook_feeds,
+            'Same tensor is fed by two hooks.')
+        hook_feeds.update(stateless_feeds)
+      else:
+        # Reuse the feeds merged at the first step, they are copied below
+        # before being modified.
+        hook_feeds = stateless_feeds
 
     if not hook_feeds:
       return user_feed_dict
@@ -765,9 +880,30 @@ class _HookedSession(_WrappedSession):
     self._raise_if_feeds_intersects(
         user_feed_dict, hook_feeds,
         'Same tensor is fed by a SessionRunHook and user.')
+    if hook_feeds is stateless_feeds:
+      hook_feeds = dict(hook_feeds)
     hook_feeds.update(user_feed_dict)
     return hook_feeds
 
+  def _collect_hook_requests(self, run_context, before_run_callbacks,
+                             fetch_requests, hook_feeds, hook_options):
+    """Calls the before_run callbacks and accumulates their requests."""
+    for hook, before_run in before_run_callbacks:
+      request = before_run(run_context)
+      if request is not None:
+        if request.fetches is not None:
+          if not hasattr(request, 'unflatten'):
+            request = session_run_hook.SessionRunArgs(
+                request.fetches, request.feed_dict, request.options)
+          fetch_requests.append((hook, request))
+        if request.feed_dict:
+          self._raise_if_feeds_intersects(
+              hook_feeds, request.feed_dict,
+              'Same tensor is fed by two hooks.')
+          hook_feeds.update(request.feed_dict)
+        if request.options:
+          hook_options.append(request.options)
+
   def _raise_if_feeds_intersects(self, feeds1, feeds2, message):
     intersection = set(feeds1.keys()) & set(feeds2.keys())
     if intersection:
@@ -20,6 +20,8 @@ from __future__ import division
 from __future__ import print_function
 
 from collections import Counter
+from collections import namedtuple
+import gc
 import glob
 import os
 import threading
@@ -30,6 +32,7 @@ import tensorflow as tf
 from tensorflow.contrib import testing
 from tensorflow.core.protobuf import config_pb2
 from tensorflow.python.training import monitored_session
+from tensorflow.python.training import session_run_hook
 
 
 class ScaffoldTest(tf.test.TestCase):
@@ -532,6 +535,262 @@ class HookedSessionTest(tf.test.TestCase):
         self.assertEqual(hook.call_counter['before_run'], 1)
         self.assertEqual(hook.call_counter['after_run'], 1)
 
+  def testSkipsDefaultCallbacks(self):
+
+    class AfterRunOnlyHook(tf.train.SessionRunHook):
+
+      def __init__(self):
+        self.last_run_values = None
+
+      def after_run(self, run_context, run_values):
+        self.last_run_values = run_values
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      after_run_hook = AfterRunOnlyHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook, after_run_hook])
+      self.assertEqual(
+          [hook for hook, _ in mon_sess._before_run_callbacks], [mock_hook])
+      self.assertEqual(
+          [hook for hook, _ in mon_sess._after_run_callbacks],
+          [mock_hook, after_run_hook])
+
+      a_tensor = tf.constant([0], name='a_tensor')
+      self.assertEqual(mon_sess.run(a_tensor), [0])
+      self.assertEqual(mock_hook.call_counter['before_run'], 1)
+      self.assertEqual(mock_hook.call_counter['after_run'], 1)
+      self.assertIsNone(after_run_hook.last_run_values.results)
+
+  def testDefaultBeforeRunArgsAreReadOnly(self):
+    with tf.Graph().as_default():
+      run_args = tf.train.SessionRunHook().before_run(None)
+      self.assertEqual(run_args, tf.train.SessionRunArgs(None))
+      with self.assertRaisesRegexp(AttributeError, 'cannot be modified'):
+        run_args.fetches = [tf.constant([0])]
+      with self.assertRaisesRegexp(AttributeError, 'cannot be modified'):
+        run_args.feed_dict = {}
+      self.assertIsNone(tf.train.SessionRunHook().before_run(None).fetches)
+
+  def testCallsStatelessHookBeforeRunOnce(self):
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      stateless_hook = FakeHook()
+      stateless_hook.stateless = True
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook, stateless_hook])
+      a_tensor = tf.constant([0], name='a_tensor')
+      another_tensor = tf.constant([5], name='another_tensor')
+      b_tensor = tf.constant([0], name='b_tensor')
+      stateless_hook.request = tf.train.SessionRunArgs(
+          [another_tensor], feed_dict={b_tensor: [10]})
+
+      c_tensor = tf.constant([0], name='c_tensor')
+      for _ in range(3):
+        self.assertEqual(mon_sess.run(fetches=a_tensor + b_tensor), [10])
+        self.assertEqual(stateless_hook.last_run_values.results, [5])
+        self.assertEqual(
+            mon_sess.run(fetches=b_tensor + c_tensor,
+                         feed_dict={c_tensor: [20]}), [30])
+      with self.assertRaisesRegexp(RuntimeError, 'Same tensor is fed'):
+        mon_sess.run(fetches=a_tensor, feed_dict={b_tensor: [20]})
+      self.assertEqual(mock_hook.call_counter['before_run'], 7)
+      self.assertEqual(stateless_hook.call_counter['before_run'], 1)
+      self.assertEqual(stateless_hook.call_counter['after_run'], 6)
+
+  def testCallsOverriddenBeforeRunOfStatelessHook(self):
+
+    class StatelessHook(FakeHook):
+      stateless = True
+
+    class PerStepHook(StatelessHook):
+
+      def __init__(self, tensors):
+        StatelessHook.__init__(self)
+        self.tensors = tensors
+
+      def before_run(self, run_context):
+        self.request = tf.train.SessionRunArgs(
+            self.tensors[self.call_counter['before_run']])
+        return StatelessHook.before_run(self, run_context)
+
+    class PerStepStopAtStepHook(tf.train.StopAtStepHook):
+
+      def before_run(self, run_context):
+        return tf.train.StopAtStepHook.before_run(self, run_context)
+
+    # pylint: disable=protected-access
+    self.assertTrue(session_run_hook._is_stateless(
+        tf.train.StopAtStepHook(num_steps=1)))
+    self.assertFalse(session_run_hook._is_stateless(
+        PerStepStopAtStepHook(num_steps=1)))
+    # pylint: enable=protected-access
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+      tensors = [tf.constant([i]) for i in range(3)]
+      per_step_hook = PerStepHook(tensors)
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[per_step_hook])
+      a_tensor = tf.constant([0], name='a_tensor')
+      for i in range(3):
+        mon_sess.run(a_tensor)
+        self.assertEqual(per_step_hook.last_run_values.results, [i])
+      self.assertEqual(per_step_hook.call_counter['before_run'], 3)
+
+  def testHonorsStatelessOverrides(self):
+
+    class OptOutNanTensorHook(tf.train.NanTensorHook):
+      stateless = False
+
+    class PropertyHook(FakeHook):
+
+      @property
+      def stateless(self):
+        return False
+
+    class OptInHook(FakeHook):
+      stateless = True
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+      a_tensor = tf.constant([0], name='a_tensor')
+      # pylint: disable=protected-access
+      self.assertFalse(session_run_hook._is_stateless(
+          OptOutNanTensorHook(a_tensor)))
+      self.assertFalse(session_run_hook._is_stateless(PropertyHook()))
+      self.assertTrue(session_run_hook._is_stateless(OptInHook()))
+      # pylint: enable=protected-access
+
+      property_hook = PropertyHook()
+      opt_in_hook = OptInHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[property_hook, opt_in_hook])
+      for _ in range(3):
+        mon_sess.run(a_tensor)
+      self.assertEqual(property_hook.call_counter['before_run'], 3)
+      self.assertEqual(opt_in_hook.call_counter['before_run'], 1)
+
+  def testCallsOnErrorInsteadOfAfterRun(self):
+
+    class OnErrorHook(FakeHook):
+
+      def __init__(self):
+        FakeHook.__init__(self)
+        self.last_error = None
+
+      def on_error(self, run_context, error):
+        self.call_counter['on_error'] += 1
+        self.last_error = error
+        run_context.request_stop()
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      on_error_hook = OnErrorHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook, on_error_hook])
+      queue = tf.FIFOQueue(1, tf.int32)
+      sess.run(queue.close())
+
+      with self.assertRaises(tf.errors.OutOfRangeError):
+        mon_sess.run(queue.dequeue())
+      for hook in [mock_hook, on_error_hook]:
+        self.assertEqual(hook.call_counter['before_run'], 1)
+        self.assertEqual(hook.call_counter['after_run'], 0)
+      self.assertEqual(on_error_hook.call_counter['on_error'], 1)
+      self.assertIsInstance(on_error_hook.last_error, tf.errors.OutOfRangeError)
+      self.assertTrue(mon_sess.should_stop())
+
+  def testCallsOnErrorOfAllHooksWhenOneRaises(self):
+
+    class RaisingOnErrorHook(FakeHook):
+
+      def on_error(self, run_context, error):
+        self.call_counter['on_error'] += 1
+        raise ValueError('on_error failed')
+
+    class StopOnErrorHook(FakeHook):
+
+      def on_error(self, run_context, error):
+        self.call_counter['on_error'] += 1
+        run_context.request_stop()
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+      raising_hook = RaisingOnErrorHook()
+      stop_hook = StopOnErrorHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[raising_hook, stop_hook])
+      queue = tf.FIFOQueue(1, tf.int32)
+      sess.run(queue.close())
+
+      with self.assertRaises(tf.errors.OutOfRangeError):
+        mon_sess.run(queue.dequeue())
+      self.assertEqual(raising_hook.call_counter['on_error'], 1)
+      self.assertEqual(stop_hook.call_counter['on_error'], 1)
+      self.assertTrue(mon_sess.should_stop())
+
+  def testRunContextHoldsSessionWeakly(self):
+
+    class FakeSession(object):
+      pass
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook])
+      mon_sess.run(tf.constant([0], name='a_tensor'))
+      self.assertIs(mock_hook.last_run_context.session, sess)
+
+    session = FakeSession()
+    run_context = tf.train.SessionRunContext(
+        original_args=None, session=session)
+    self.assertIs(run_context.session, session)
+    del session
+    gc.collect()
+    self.assertIsNone(run_context.session)
+
+    # None and objects which cannot be weakly referenced are held.
+    for session in [None, object()]:
+      run_context = tf.train.SessionRunContext(
+          original_args=None, session=session)
+      self.assertIs(run_context.session, session)
+
+  def testReusesRunContext(self):
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook])
+      a_tensor = tf.constant([0], name='a_tensor')
+      b_tensor = tf.constant([5], name='b_tensor')
+
+      mon_sess.run(a_tensor)
+      first_run_context = mock_hook.last_run_context
+      mock_hook.should_stop = True
+      mon_sess.run(b_tensor)
+      self.assertIs(mock_hook.last_run_context, first_run_context)
+      self.assertEqual(mock_hook.last_run_context.original_args,
+                       tf.train.SessionRunArgs(b_tensor))
+      self.assertTrue(mon_sess.should_stop())
+
+  def testUsesOwnRunContextWhileSharedOneIsInUse(self):
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook])
+      a_tensor = tf.constant([0], name='a_tensor')
+      b_tensor = tf.constant([5], name='b_tensor')
+
+      mon_sess.run(a_tensor)
+      shared_run_context = mock_hook.last_run_context
+      # Simulates a step running in another thread.
+      with mon_sess._run_context_lock:
+        mock_hook.should_stop = True
+        self.assertEqual(mon_sess.run(b_tensor), [5])
+      self.assertIsNot(mock_hook.last_run_context, shared_run_context)
+      self.assertEqual(mock_hook.last_run_context.original_args,
+                       tf.train.SessionRunArgs(b_tensor))
+      self.assertEqual(shared_run_context.original_args,
+                       tf.train.SessionRunArgs(a_tensor))
+      self.assertTrue(mon_sess.should_stop())
+
   def testShouldStop(self):
     with tf.Graph().as_default(), tf.Session() as sess:
       mock_hook = FakeHook()
@@ -566,6 +825,95 @@ class HookedSessionTest(tf.test.TestCase):
       self.assertEqual(mock_hook.last_run_values.results, [5])
       self.assertEqual(mock_hook2.last_run_values.results, [10])
 
+  def testFetchesNestedHookRequests(self):
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      mock_hook2 = FakeHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook, mock_hook2])
+      a_tensor = tf.constant([0], name='a_tensor')
+      another_tensor = tf.constant([5], name='another_tensor')
+      third_tensor = tf.constant([10], name='third_tensor')
+      mock_hook.request = tf.train.SessionRunArgs(
+          {'another': another_tensor, 'both': (a_tensor, [third_tensor])})
+      mock_hook2.request = tf.train.SessionRunArgs(third_tensor)
+
+      output = mon_sess.run(fetches={'a': a_tensor})
+      self.assertEqual(output, {'a': [0]})
+      self.assertEqual(mock_hook.last_run_values.results,
+                       {'another': [5], 'both': ([0], [[10]])})
+      self.assertEqual(mock_hook2.last_run_values.results, [10])
+
+  def testFetchesSingleFetchHookRequests(self):
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook])
+      a_tensor = tf.constant([0], name='a_tensor')
+      another_tensor = tf.constant([5], name='another_tensor')
+      mock_hook.request = tf.train.SessionRunArgs.single(another_tensor)
+      self.assertIsInstance(mock_hook.request, tf.train.SessionRunArgs)
+      self.assertEqual(mock_hook.request,
+                       tf.train.SessionRunArgs(another_tensor))
+
+      self.assertEqual(mon_sess.run(fetches=a_tensor), [0])
+      self.assertEqual(mock_hook.last_run_values.results, [5])
+
+      # The returned args can be modified like any other SessionRunArgs.
+      b_tensor = tf.constant([0], name='b_tensor')
+      mock_hook.request.fetches = [another_tensor + b_tensor]
+      mock_hook.request.feed_dict = {b_tensor: [10]}
+      self.assertEqual(mon_sess.run(fetches=a_tensor), [0])
+      self.assertEqual(mock_hook.last_run_values.results, [[15]])
+
+  def testFetchesNamedTupleHookRequests(self):
+    request_type = namedtuple('Request', ['fetches', 'feed_dict', 'options'])
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = FakeHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook])
+      a_tensor = tf.constant([0], name='a_tensor')
+      b_tensor = tf.constant([0], name='b_tensor')
+      mock_hook.request = request_type(
+          fetches=[b_tensor + 5], feed_dict={b_tensor: [10]}, options=None)
+
+      self.assertEqual(mon_sess.run(fetches=a_tensor + b_tensor), [10])
+      self.assertEqual(mock_hook.last_run_values.results, [[15]])
+
+  def testBuildsHookResultsOnlyWhenRead(self):
+
+    class CountingRunArgs(tf.train.SessionRunArgs):
+
+      def __init__(self, fetches):
+        tf.train.SessionRunArgs.__init__(self, fetches)
+        self.unflatten_calls = 0
+
+      def unflatten(self, flat_results):
+        self.unflatten_calls += 1
+        return tf.train.SessionRunArgs.unflatten(self, flat_results)
+
+    class RunMetadataHook(FakeHook):
+
+      def after_run(self, run_context, run_values):
+        FakeHook.after_run(self, run_context, run_values)
+        self.last_run_metadata = run_values.run_metadata
+
+    with tf.Graph().as_default(), tf.Session() as sess:
+      mock_hook = RunMetadataHook()
+      mon_sess = monitored_session._HookedSession(
+          sess=sess, hooks=[mock_hook])
+      a_tensor = tf.constant([0], name='a_tensor')
+      another_tensor = tf.constant([5], name='another_tensor')
+      mock_hook.request = CountingRunArgs([another_tensor])
+
+      self.assertEqual(mon_sess.run(fetches=a_tensor), [0])
+      self.assertIsInstance(mock_hook.last_run_metadata,
+                            config_pb2.RunMetadata)
+      self.assertEqual(mock_hook.request.unflatten_calls, 0)
+      self.assertEqual(mock_hook.last_run_values.results, [[5]])
+      self.assertEqual(mock_hook.last_run_values.results, [[5]])
+      self.assertEqual(mock_hook.request.unflatten_calls, 1)
+
   def testOnlyHooksHaveFeeds(self):
     with tf.Graph().as_default(), tf.Session() as sess:
       mock_hook = FakeHook()
@@ -989,6 +1337,39 @@ class MonitoredSessionTest(tf.test.TestCase):
       self.assertTrue(session.should_stop())
       self.assertTrue(session._is_closed())
 
+  def test_skip_hooks(self):
+    with tf.Graph().as_default():
+      gstep = tf.contrib.framework.get_or_create_global_step()
+      do_step = tf.assign_add(gstep, 1)
+      hook = FakeHook()
+      with tf.train.MonitoredSession(hooks=[hook]) as session:
+        self.assertEqual(1, session.run(do_step))
+        with tf.train.skip_hooks(session):
+          self.assertEqual(2, session.run(do_step))
+          self.assertEqual(3, session.run(do_step))
+        self.assertEqual(4, session.run(do_step))
+        self.assertEqual(2, hook.call_counter['before_run'])
+        self.assertEqual(2, hook.call_counter['after_run'])
+
+  def test_hook_with_only_some_callbacks(self):
+
+    class AfterRunOnlyHook(session_run_hook._AfterRunMixin):
+
+      def __init__(self):
+        self.steps = []
+
+      def after_run(self, run_context, run_values):
+        self.steps.append(run_values.results)
+
+    with tf.Graph().as_default():
+      gstep = tf.contrib.framework.get_or_create_global_step()
+      do_step = tf.assign_add(gstep, 1)
+      hook = AfterRunOnlyHook()
+      with tf.train.MonitoredSession(hooks=[hook]) as session:
+        self.assertEqual(1, session.run(do_step))
+        self.assertEqual(2, session.run(do_step))
+      self.assertEqual([None, None], hook.steps)
+
   def test_graph(self):
     g = tf.Graph()
     with g.as_default():
@@ -66,7 +66,11 @@ Above user code leads to following execution:
   sess = tf.Session()
   while not stop is requested:
     call hooks.before_run()
-    results = sess.run(merged_fetches)
+    try:
+      results = sess.run(merged_fetches)
+    except Exception as e:
+      call hooks.on_error()
+      raise
     call hooks.after_run()
   call hooks.end()
   sess.close()
@@ -75,17 +79,19 @@ Above user code leads to following execution:
 @@SessionRunArgs
 @@SessionRunContext
 @@SessionRunValues
+@@skip_hooks
 """
 
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import collections
+import contextlib
+import weakref
 
 
-class SessionRunHook(object):
-  """Hook to extend calls to MonitoredSession.run()."""
+class _BeginMixin(object):
+  """Part of `SessionRunHook` called when the session is created."""
 
   def begin(self):
     """Called once before using the session.
@@ -98,6 +104,10 @@ class SessionRunHook(object):
     """
     pass
 
+
+class _BeforeRunMixin(object):
+  """Part of `SessionRunHook` called before each step."""
+
   def before_run(self, run_context):  # pylint: disable=unused-argument
     """Called before each call to run().
 
@@ -117,9 +127,14 @@ class SessionRunHook(object):
       run_context: A `SessionRunContext` object.
 
     Returns:
-      None or a `SessionRunArgs` object.
+      None or a `SessionRunArgs` object. The default implementation returns a
+      shared `SessionRunArgs` which requests nothing; it must not be modified.
     """
-    return None
+    return _EMPTY_RUN_ARGS
+
+
+class _AfterRunMixin(object):
+  """Part of `SessionRunHook` called after each step."""
 
   def after_run(self,
                 run_context,  # pylint: disable=unused-argument
@@ -138,6 +153,10 @@ class SessionRunHook(object):
     """
     pass
 
+
+class _EndMixin(object):
+  """Part of `SessionRunHook` called when the session is closed."""
+
   def end(self, session):  # pylint: disable=unused-argument
     """Called at the end of session.
 
@@ -150,9 +169,110 @@ class SessionRunHook(object):
     pass
 
 
-class SessionRunArgs(
-    collections.namedtuple("SessionRunArgs",
-                           ["fetches", "feed_dict", "options"])):
+class SessionRunHook(_BeginMixin, _BeforeRunMixin, _AfterRunMixin, _EndMixin):
+  """Hook to extend calls to MonitoredSession.run().
+
+  Subclasses only need to override the callbacks they care about.
+  `MonitoredSession` does not call a callback which is left as the no-op
+  defined here.
+
+  A hook whose `before_run()` has no side effects and returns the same request
+  at every step can set `stateless` to True. `MonitoredSession` then calls its
+  `before_run()` only for the first step run by a session and reuses the
+  returned request for the following steps. The flag only applies to the
+  `before_run()` of the class which sets it: a subclass overriding
+  `before_run()` of a stateless hook is called at every step unless it sets
+  `stateless` itself.
+  """
+
+  stateless = False
+
+  def on_error(self,
+               run_context,  # pylint: disable=unused-argument
+               error):  # pylint: disable=unused-argument
+    """Called instead of `after_run()` when the call to run() raises.
+
+    The `run_context` argument is the same one send to `before_run` call. The
+    error is re-raised by `MonitoredSession` once all hooks have been notified,
+    but `run_context.request_stop()` can still be called to stop the
+    iteration. Exceptions raised by `on_error()` are logged, and the other
+    hooks are still notified.
+
+    Args:
+      run_context: A `SessionRunContext` object.
+      error: The exception raised by the `run()` call.
+    """
+    pass
+
+
+# The no-op callbacks of `SessionRunHook`, which need not be called.
+_NO_OP_CALLBACKS = {
+    "begin": _BeginMixin.__dict__["begin"],
+    "before_run": _BeforeRunMixin.__dict__["before_run"],
+    "after_run": _AfterRunMixin.__dict__["after_run"],
+    "on_error": SessionRunHook.__dict__["on_error"],
+    "end": _EndMixin.__dict__["end"],
+}
+
+
+def _implements(hook, method_name):
+  """Returns whether `hook` provides its own `method_name` callback.
+
+  Used by `MonitoredSession` to skip, once and for all, the callbacks which a
+  hook inherits as no-ops from `SessionRunHook`, or does not have at all
+  because it only derives from some of the mixins `SessionRunHook` is made of.
+
+  Args:
+    hook: A `SessionRunHook` or any object providing the same methods.
+    method_name: Name of a `SessionRunHook` callback, e.g. 'before_run'.
+
+  Returns:
+    False if `hook` has no `method_name` or if it is the default no-op of
+    `SessionRunHook`, True otherwise.
+  """
+  method = getattr(hook, method_name, None)
+  if method is None:
+    return False
+  return (getattr(method, "__func__", method) is not
+          _NO_OP_CALLBACKS[method_name])
+
+
+def _is_stateless(hook):
+  """Returns whether `MonitoredSession` may reuse the requests of `hook`.
+
+  The value of `hook.stateless` is used, unless it is inherited from a base of
+  the class which defines the `before_run()` in use: a subclass overriding
+  `before_run()` of a stateless hook is called at every step unless it sets
+  `stateless` itself.
+
+  Args:
+    hook: A `SessionRunHook` or any object providing the same methods.
+
+  Returns:
+    True if `before_run()` of `hook` only needs to be called once.
+  """
+  if not getattr(hook, "stateless", False):
+    return False
+  instance_attrs = getattr(hook, "__dict__", {})
+  if "stateless" in instance_attrs:
+    return True
+  if "before_run" in instance_attrs:
+    return False
+  # Python 2 old-style classes have no `__mro__`, their hooks are simply
+  # called at every step.
+  mro = getattr(hook.__class__, "__mro__", None)
+  if mro is None:
+    return False
+  stateless_index = next(
+      (i for i, cls in enumerate(mro) if "stateless" in cls.__dict__), None)
+  before_run_index = next(
+      (i for i, cls in enumerate(mro) if "before_run" in cls.__dict__), None)
+  if stateless_index is None or before_run_index is None:
+    return True
+  return stateless_index <= before_run_index
+
+
+class SessionRunArgs(object):
   """Represents arguments to be added to a `Session.run()` call.
 
   Args:
@@ -170,8 +290,198 @@ class SessionRunArgs(
       config_pb2.RunOptions proto.
   """
 
-  def __new__(cls, fetches, feed_dict=None, options=None):
-    return super(SessionRunArgs, cls).__new__(cls, fetches, feed_dict, options)
+  __slots__ = ("_fetches", "feed_dict", "options", "_flat_fetches",
+               "_fetch_template")
+  __match_args__ = ("fetches", "feed_dict", "options")
+
+  def __init__(self, fetches, feed_dict=None, options=None):
+    self._fetches = fetches
+    self.feed_dict = feed_dict
+    self.options = options
+    self._flat_fetches = None
+    self._fetch_template = None
+
+  @property
+  def fetches(self):
+    return self._fetches
+
+  @fetches.setter
+  def fetches(self, fetches):
+    # The flattened fetches are computed again for the new value.
+    self._fetches = fetches
+    self._flat_fetches = None
+    self._fetch_template = None
+
+  @property
+  def flat_fetches(self):
+    """A tuple with the graph elements found in the nested `fetches`.
+
+    The structure of `fetches` is walked the first time this is read, and the
+    result is kept until `fetches` is assigned, so the nested `fetches` must
+    not be modified in place afterwards.
+
+    Returns:
+      A tuple of the fetched graph elements, in a deterministic order.
+    """
+    if self._flat_fetches is None:
+      self._flatten()
+    return self._flat_fetches
+
+  def unflatten(self, flat_results):
+    """Gives values fetched for `flat_fetches` the nested shape of `fetches`.
+
+    Args:
+      flat_results: A sequence with one value per element of `flat_fetches`.
+
+    Returns:
+      The values in `flat_results` arranged like `Session.run(fetches)` would
+      have returned them.
+    """
+    if self._flat_fetches is None:
+      self._flatten()
+    if self._fetch_template is None:
+      return flat_results[0]
+    return _pack_results(self._fetch_template, iter(flat_results))
+
+  def _flatten(self):
+    flat_fetches = []
+    self._fetch_template = _flatten_fetches(self.fetches, flat_fetches)
+    self._flat_fetches = tuple(flat_fetches)
+
+  @classmethod
+  def single(cls, fetch):
+    """Returns run args which only fetch `fetch`, without feeds or options.
+
+    This is the most common request of hooks. `fetch` is known not to be
+    nested, so the returned object need not walk it when merged.
+
+    Args:
+      fetch: A single graph element, as accepted by `Session.run()`.
+
+    Returns:
+      An instance of `cls` equal to `cls(fetch)`.
+    """
+    run_args = cls(fetch)
+    run_args._flat_fetches = (fetch,)
+    return run_args
+
+  def __eq__(self, other):
+    if not isinstance(other, SessionRunArgs):
+      return NotImplemented
+    return ((self.fetches, self.feed_dict, self.options) ==
+            (other.fetches, other.feed_dict, other.options))
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __hash__(self):
+    return hash((self.fetches, self.feed_dict, self.options))
+
+  def __repr__(self):
+    return "SessionRunArgs(fetches=%r, feed_dict=%r, options=%r)" % (
+        self.fetches, self.feed_dict, self.options)
+
+
+def _flatten_fetches(fetches, flat_fetches):
+  """Appends the leaves of `fetches` to `flat_fetches`.
+
+  Lists, tuples (including namedtuples) and dicts are walked, anything else is
+  a graph element, as in `Session.run()`.
+
+  Args:
+    fetches: A graph element or nested structure of graph elements.
+    flat_fetches: A list the graph elements are appended to.
+
+  Returns:
+    A template to give the fetched values the structure of `fetches` in
+    `_pack_results()`.  None if `fetches` is a graph element.
+  """
+  if isinstance(fetches, dict):
+    keys = list(fetches.keys())
+    return (dict, keys,
+            [_flatten_fetches(fetches[k], flat_fetches) for k in keys])
+  if isinstance(fetches, (list, tuple)):
+    return (type(fetches), None,
+            [_flatten_fetches(f, flat_fetches) for f in fetches])
+  flat_fetches.append(fetches)
+  return None
+
+
+def _pack_results(template, results_iter):
+  """Inverse of `_flatten_fetches()`, consumes values from `results_iter`."""
+  if template is None:
+    return next(results_iter)
+  fetch_type, keys, templates = template
+  results = [_pack_results(t, results_iter) for t in templates]
+  if keys is not None:
+    return dict(zip(keys, results))
+  if fetch_type is list:
+    return results
+  if fetch_type is tuple:
+    return tuple(results)
+  # This is the code path for namedtuple.
+  return fetch_type(*results)
+
+
+def _merge_run_args(fetches, run_args_list):
+  """Merges the fetches of several `SessionRunArgs` behind `fetches`.
+
+  Args:
+    fetches: The fetches of the caller of `run()`, kept as they are.
+    run_args_list: A list of `SessionRunArgs` with the requests of hooks.
+
+  Returns:
+    A tuple `(merged_fetches, offsets)`. `merged_fetches` is a list starting
+    with `fetches`, followed by the `flat_fetches` of each element of
+    `run_args_list`. The values fetched for `run_args_list[i]` are found in
+    `results[offsets[i]:offsets[i + 1]]` of the results of `merged_fetches`.
+  """
+  merged_fetches = [fetches]
+  offsets = [1]
+  for run_args in run_args_list:
+    merged_fetches.extend(run_args.flat_fetches)
+    offsets.append(len(merged_fetches))
+  return merged_fetches, offsets
+
+
+class _EmptyRunArgs(SessionRunArgs):
+  """Read-only `SessionRunArgs` requesting nothing."""
+
+  __slots__ = ()
+
+  def __init__(self):  # pylint: disable=super-init-not-called
+    # The flattened fetches are set here as well, they cannot be filled in
+    # lazily once the object is read-only.
+    for name, value in (("_fetches", None), ("feed_dict", None),
+                        ("options", None), ("_flat_fetches", (None,)),
+                        ("_fetch_template", None)):
+      object.__setattr__(self, name, value)
+
+  def __setattr__(self, name, value):
+    raise AttributeError(_EMPTY_RUN_ARGS_READ_ONLY)
+
+  def __delattr__(self, name):
+    raise AttributeError(_EMPTY_RUN_ARGS_READ_ONLY)
+
+
+_EMPTY_RUN_ARGS_READ_ONLY = (
+    "The SessionRunArgs returned by the default before_run() is shared by all "
+    "hooks and cannot be modified, return a new SessionRunArgs instead.")
+
+
+# Returned by the default `SessionRunHook.before_run()` so that no new object
+# is built for hooks which do not request anything. Shared by all hooks, so it
+# is read-only.
+_EMPTY_RUN_ARGS = _EmptyRunArgs()
+
+
+def _session_ref(session):
+  """Returns a callable giving back `session` without keeping it alive."""
+  try:
+    return weakref.ref(session)
+  except TypeError:
+    # Not every object can be weakly referenced, those are simply held.
+    return lambda: session
 
 
 class SessionRunContext(object):
@@ -181,12 +491,24 @@ class SessionRunContext(object):
   SessionRunHook objects can stop the loop by calling `request_stop()` of
   `run_context`. In the future we may use this object to add more information
   about run without changing the Hook API.
+
+  `MonitoredSession` passes the same object, updated for the current call, at
+  every step, so hooks should not keep it to look at a previous step. A
+  `run()` call made while another one is in progress on the same session, from
+  another thread, gets a context of its own.
   """
 
+  __slots__ = ("_original_args", "_session", "_stop_requested")
+  __match_args__ = ("original_args", "session", "stop_requested")
+
   def __init__(self, original_args, session):
     """Initializes SessionRunContext."""
+    self._session = _session_ref(session)
+    self._reset(original_args)
+
+  def _reset(self, original_args):
+    """Prepares the context for a new `run()` call on the same session."""
     self._original_args = original_args
-    self._session = session
     self._stop_requested = False
 
   @property
@@ -203,8 +525,12 @@ class SessionRunContext(object):
 
   @property
   def session(self):
-    """A TensorFlow session object which will execute the `run`."""
-    return self._session
+    """A TensorFlow session object which will execute the `run`.
+
+    The context does not keep the session alive, so this is only guaranteed to
+    be valid during the hook calls it is passed to.
+    """
+    return self._session()
 
   @property
   def stop_requested(self):
@@ -225,9 +551,7 @@ class SessionRunContext(object):
     self._stop_requested = True
 
 
-class SessionRunValues(
-    collections.namedtuple("SessionRunValues",
-                           ["results", "options", "run_metadata"])):
+class SessionRunValues(object):
   """Contains the results of `Session.run()`.
 
   In the future we may use this object to add more information about result of
@@ -246,3 +570,101 @@ class SessionRunValues(
     options: `RunOptions` from the `Session.run()` call.
     run_metadata: `RunMetadata` from the `Session.run()` call.
   """
+
+  __slots__ = ("_results", "_run_args", "_flat_results", "options",
+               "run_metadata")
+  __match_args__ = ("results", "options", "run_metadata")
+
+  def __init__(self, results, options, run_metadata):
+    self._results = results
+    self._run_args = None
+    self._flat_results = None
+    self.options = options
+    self.run_metadata = run_metadata
+
+  @classmethod
+  def _from_flat_results(cls, run_args, flat_results, options, run_metadata):
+    """Creates values whose `results` are only built when first read.
+
+    Args:
+      run_args: The `SessionRunArgs` the results were fetched for.
+      flat_results: The values fetched for `run_args.flat_fetches`.
+      options: `RunOptions` from the `Session.run()` call.
+      run_metadata: `RunMetadata` from the `Session.run()` call.
+
+    Returns:
+      A `SessionRunValues` object.
+    """
+    values = cls(None, options, run_metadata)
+    values._run_args = run_args
+    values._flat_results = flat_results
+    return values
+
+  @property
+  def results(self):
+    """The values fetched for the hook, shaped like its `fetches`."""
+    if self._run_args is not None:
+      self._results = self._run_args.unflatten(self._flat_results)
+      self._run_args = None
+      self._flat_results = None
+    return self._results
+
+  def __eq__(self, other):
+    if not isinstance(other, SessionRunValues):
+      return NotImplemented
+    return ((self.results, self.options, self.run_metadata) ==
+            (other.results, other.options, other.run_metadata))
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __hash__(self):
+    return hash((self.results, self.options, self.run_metadata))
+
+  def __repr__(self):
+    return "SessionRunValues(results=%r, options=%r, run_metadata=%r)" % (
+        self.results, self.options, self.run_metadata)
+
+
+class _NullHookDispatcher(object):
+  """Runs steps of a `MonitoredSession` without calling its hooks."""
+
+  def dispatch(self, session, fetches, feed_dict=None, options=None,
+               run_metadata=None):
+    return session.run(fetches,
+                       feed_dict=feed_dict,
+                       options=options,
+                       run_metadata=run_metadata)
+
+
+@contextlib.contextmanager
+def skip_hooks(monitored_session):
+  """Context manager running `monitored_session` without its hooks.
+
+  Within the context, calls to `monitored_session.run()` go straight to the
+  underlying TensorFlow session: no `SessionRunHook` callback is called, and
+  `AbortedError` is not recovered from. This is useful for steps which the
+  hooks should not observe, such as re-initializing an input pipeline.
+
+  ```python
+  with MonitoredSession(hooks=your_hooks) as sess:
+    with tf.train.skip_hooks(sess):
+      sess.run(iterator_init_op)
+    while not sess.should_stop():
+      sess.run(train_op)
+  ```
+
+  Args:
+    monitored_session: A `MonitoredSession` object.
+
+  Yields:
+    Nothing.
+  """
+  # pylint: disable=protected-access
+  old_dispatcher = monitored_session._hook_dispatcher
+  monitored_session._hook_dispatcher = _NullHookDispatcher()
+  try:
+    yield
+  finally:
+    monitored_session._hook_dispatcher = old_dispatcher
+  # pylint: enable=protected-access
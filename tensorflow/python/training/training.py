@@ -164,6 +164,7 @@ overview of summaries, event files, and visualization in TensorBoard.
 @@SessionRunArgs
 @@SessionRunContext
 @@SessionRunValues
+@@skip_hooks
 @@LooperThread
 """
 # pylint: enable=line-too-long
@@ -235,6 +236,7 @@ from tensorflow.python.training.session_run_hook import SessionRunHook
 from tensorflow.python.training.session_run_hook import SessionRunArgs
 from tensorflow.python.training.session_run_hook import SessionRunContext
 from tensorflow.python.training.session_run_hook import SessionRunValues
+from tensorflow.python.training.session_run_hook import skip_hooks
 from tensorflow.python.training.session_manager import SessionManager
 from tensorflow.python.training.summary_io import summary_iterator
 from tensorflow.python.training.summary_io import SummaryWriter